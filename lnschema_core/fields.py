@@ -279,3 +279,51 @@ class ImageField(models.ImageField):
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("blank", True)
         super().__init__(*args, **kwargs)
+
+
+# maps Django's internal field types onto pyarrow type aliases, see
+# https://arrow.apache.org/docs/python/api/datatypes.html
+# JSON is passed as serialized strings because the structure of values can
+# vary from row to row
+ARROW_TYPE_ALIASES = {
+    "AutoField": "int32",
+    "BigAutoField": "int64",
+    "SmallAutoField": "int16",
+    "IntegerField": "int32",
+    "BigIntegerField": "int64",
+    "SmallIntegerField": "int16",
+    "PositiveIntegerField": "int64",
+    "PositiveSmallIntegerField": "int32",
+    "PositiveBigIntegerField": "uint64",
+    "FloatField": "double",
+    "DecimalField": "string",
+    "BooleanField": "bool",
+    "CharField": "string",
+    "TextField": "string",
+    "SlugField": "string",
+    "URLField": "string",
+    "EmailField": "string",
+    "UUIDField": "string",
+    "GenericIPAddressField": "string",
+    "FileField": "string",
+    "ImageField": "string",
+    "JSONField": "string",
+    "BinaryField": "binary",
+    "DateField": "date32",
+    "DateTimeField": "timestamp[us]",
+    "TimeField": "time64[us]",
+    "DurationField": "duration[us]",
+}
+
+
+def arrow_type_alias(field: models.Field) -> str:
+    """Arrow type alias of a field, e.g., `"int64"` for a `BigIntegerField`.
+
+    Pass the result to `pyarrow.type_for_alias()`. Relational fields map onto
+    the type of the primary key they point to. Date-times map onto the
+    timezone-naive `"timestamp[us]"` because aliases can't carry a timezone; use
+    `pyarrow.timestamp("us", tz="UTC")` to keep the UTC timezone of the values.
+    """
+    if field.many_to_one or field.one_to_one:
+        field = field.target_field
+    return ARROW_TYPE_ALIASES.get(field.get_internal_type(), "string")
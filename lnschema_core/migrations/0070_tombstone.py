@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import lnschema_core.fields
+import lnschema_core.users
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lnschema_core", "0069_squashed"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "registry",
+                    lnschema_core.fields.CharField(
+                        blank=True, db_index=True, default=None, max_length=120
+                    ),
+                ),
+                (
+                    "record_id",
+                    lnschema_core.fields.BigIntegerField(
+                        blank=True, db_index=True, default=None
+                    ),
+                ),
+                (
+                    "record_uid",
+                    lnschema_core.fields.CharField(
+                        blank=True,
+                        db_index=True,
+                        default=None,
+                        max_length=20,
+                        null=True,
+                    ),
+                ),
+                (
+                    "created_at",
+                    lnschema_core.fields.DateTimeField(
+                        auto_now_add=True, db_index=True
+                    ),
+                ),
+                (
+                    "created_by",
+                    lnschema_core.fields.ForeignKey(
+                        blank=True,
+                        default=lnschema_core.users.current_user_id,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="lnschema_core.user",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
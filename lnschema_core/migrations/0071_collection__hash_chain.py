@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:41
+
+from django.db import migrations
+
+import lnschema_core.fields
+from lnschema_core.models import hash_chain
+
+
+def populate_hash_chain(apps, schema_editor):
+    Collection = apps.get_model("lnschema_core", "Collection")
+    CollectionArtifact = apps.get_model("lnschema_core", "CollectionArtifact")
+    db_alias = schema_editor.connection.alias
+    for collection in Collection.objects.using(db_alias).iterator():
+        artifact_hashes = (
+            CollectionArtifact.objects.using(db_alias)
+            .filter(collection_id=collection.id)
+            .order_by("id")
+            .values_list("artifact__hash", flat=True)
+        )
+        collection._hash_chain = hash_chain(artifact_hashes)
+        collection.save(update_fields=["_hash_chain"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lnschema_core", "0070_tombstone"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="collection",
+            name="_hash_chain",
+            field=lnschema_core.fields.CharField(
+                blank=True, default=None, max_length=22, null=True
+            ),
+        ),
+        migrations.RunPython(populate_hash_chain, migrations.RunPython.noop),
+    ]
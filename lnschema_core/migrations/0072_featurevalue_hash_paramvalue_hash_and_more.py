@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:31
+
+import hashlib
+import json
+from typing import Any
+
+from django.db import migrations, models
+from lamindb_setup.core.hashing import HASH_LENGTH, to_b64_str
+
+import lnschema_core.fields
+
+CHUNK_SIZE = 10_000
+
+
+# frozen copy of lnschema_core.models.hash_value
+def hash_value(value: Any) -> str:
+    def normalize(value: Any) -> Any:
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, dict):
+            return {key: normalize(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [normalize(item) for item in value]
+        return value
+
+    canonical = json.dumps(
+        normalize(value), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return to_b64_str(hashlib.md5(canonical.encode()).digest())[:HASH_LENGTH]
+
+
+def populate_value_hashes(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    for model_name in ["FeatureValue", "ParamValue"]:
+        registry = apps.get_model("lnschema_core", model_name)
+        records = []
+        for record in (
+            registry.objects.using(db_alias)
+            .only("id", "value")
+            .iterator(chunk_size=CHUNK_SIZE)
+        ):
+            record.hash = hash_value(record.value)
+            records.append(record)
+            if len(records) == CHUNK_SIZE:
+                registry.objects.using(db_alias).bulk_update(records, ["hash"])
+                records = []
+        registry.objects.using(db_alias).bulk_update(records, ["hash"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lnschema_core", "0071_collection__hash_chain"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="featurevalue",
+            name="hash",
+            field=lnschema_core.fields.CharField(
+                blank=True, default=None, max_length=22, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="paramvalue",
+            name="hash",
+            field=lnschema_core.fields.CharField(
+                blank=True, default=None, max_length=22, null=True
+            ),
+        ),
+        migrations.RunPython(populate_value_hashes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="featurevalue",
+            index=models.Index(
+                fields=["feature", "hash"], name="lnschema_co_feature_c06a15_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paramvalue",
+            index=models.Index(
+                fields=["param", "hash"], name="lnschema_co_param_i_83429a_idx"
+            ),
+        ),
+    ]
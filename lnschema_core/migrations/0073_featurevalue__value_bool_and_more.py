@@ -0,0 +1,247 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:32
+
+from datetime import datetime, timezone
+from typing import Any
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import lnschema_core.fields
+
+CHUNK_SIZE = 10_000
+
+# frozen copies of the helpers in lnschema_core.models
+TYPED_VALUE_FIELDS = {
+    "num": "_value_float",
+    "float": "_value_float",
+    "int": "_value_int",
+    "bool": "_value_bool",
+    "date": "_value_datetime",
+    "datetime": "_value_datetime",
+    "str": "_value_str",
+}
+
+
+def typed_value_field(dtype: str | None) -> str | None:
+    return TYPED_VALUE_FIELDS.get(dtype)  # type: ignore
+
+
+def to_typed_value(dtype: str | None, value: Any) -> Any:
+    field_name = typed_value_field(dtype)
+    if field_name is None or value is None or isinstance(value, (dict, list)):
+        return None
+    if field_name == "_value_bool":
+        return value if isinstance(value, bool) else None
+    if isinstance(value, bool):
+        return None
+    try:
+        if field_name == "_value_float":
+            return float(value)
+        if field_name == "_value_int":
+            if isinstance(value, float) and not value.is_integer():
+                return None
+            return int(value)
+        if field_name == "_value_datetime":
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, datetime):
+                # a date
+                value = datetime(value.year, value.month, value.day)
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value
+    except (AttributeError, TypeError, ValueError):
+        return None
+    value = str(value)
+    return value if len(value) <= 255 else None
+
+
+def populate_typed_values(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    typed_fields = list(set(TYPED_VALUE_FIELDS.values()))
+    for model_name, dimension_field in [
+        ("FeatureValue", "feature"),
+        ("ParamValue", "param"),
+    ]:
+        registry = apps.get_model("lnschema_core", model_name)
+        records = []
+        for record in (
+            registry.objects.using(db_alias)
+            .select_related(dimension_field)
+            .only("id", "value", *typed_fields, f"{dimension_field}__dtype")
+            .iterator(chunk_size=CHUNK_SIZE)
+        ):
+            dimension = getattr(record, dimension_field)
+            dtype = None if dimension is None else dimension.dtype
+            field_name = typed_value_field(dtype)
+            if field_name is None:
+                continue
+            setattr(record, field_name, to_typed_value(dtype, record.value))
+            records.append(record)
+            if len(records) == CHUNK_SIZE:
+                registry.objects.using(db_alias).bulk_update(records, typed_fields)
+                records = []
+        registry.objects.using(db_alias).bulk_update(records, typed_fields)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lnschema_core", "0072_featurevalue_hash_paramvalue_hash_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="featurevalue",
+            name="_value_bool",
+            field=lnschema_core.fields.BooleanField(
+                blank=True, default=None, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="featurevalue",
+            name="_value_datetime",
+            field=lnschema_core.fields.DateTimeField(
+                blank=True, default=None, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="featurevalue",
+            name="_value_float",
+            field=lnschema_core.fields.FloatField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="featurevalue",
+            name="_value_int",
+            field=lnschema_core.fields.BigIntegerField(
+                blank=True, default=None, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="featurevalue",
+            name="_value_str",
+            field=lnschema_core.fields.CharField(
+                blank=True, default=None, max_length=255, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="paramvalue",
+            name="_value_bool",
+            field=lnschema_core.fields.BooleanField(
+                blank=True, default=None, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="paramvalue",
+            name="_value_datetime",
+            field=lnschema_core.fields.DateTimeField(
+                blank=True, default=None, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="paramvalue",
+            name="_value_float",
+            field=lnschema_core.fields.FloatField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="paramvalue",
+            name="_value_int",
+            field=lnschema_core.fields.BigIntegerField(
+                blank=True, default=None, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="paramvalue",
+            name="_value_str",
+            field=lnschema_core.fields.CharField(
+                blank=True, default=None, max_length=255, null=True
+            ),
+        ),
+        migrations.RunPython(populate_typed_values, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="featurevalue",
+            index=models.Index(
+                fields=["feature", "_value_float"],
+                name="lnschema_co_feature_345938_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="featurevalue",
+            index=models.Index(
+                fields=["feature", "_value_int"], name="lnschema_co_feature_d1a72f_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="featurevalue",
+            index=models.Index(
+                fields=["feature", "_value_bool"], name="lnschema_co_feature_5df653_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="featurevalue",
+            index=models.Index(
+                fields=["feature", "_value_datetime"],
+                name="lnschema_co_feature_442d54_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="featurevalue",
+            index=models.Index(
+                fields=["feature", "_value_str"], name="lnschema_co_feature_51855a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paramvalue",
+            index=models.Index(
+                fields=["param", "_value_float"], name="lnschema_co_param_i_a6ed11_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paramvalue",
+            index=models.Index(
+                fields=["param", "_value_int"], name="lnschema_co_param_i_7ab430_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paramvalue",
+            index=models.Index(
+                fields=["param", "_value_bool"], name="lnschema_co_param_i_eaf055_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paramvalue",
+            index=models.Index(
+                fields=["param", "_value_datetime"],
+                name="lnschema_co_param_i_d61ca1_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paramvalue",
+            index=models.Index(
+                fields=["param", "_value_str"], name="lnschema_co_param_i_0dc766_idx"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="featurevalue",
+            name="feature",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                default=None,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="values",
+                to="lnschema_core.feature",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paramvalue",
+            name="param",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="values",
+                to="lnschema_core.param",
+            ),
+        ),
+    ]
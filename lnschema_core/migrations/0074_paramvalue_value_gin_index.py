@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:52
+
+from django.db import migrations
+
+INDEX_NAME = "lnschema_core_paramvalue_value_gin"
+
+
+def create_gin_index(apps, schema_editor):
+    # jsonb_path_ops indexes serve containment queries (@>) on nested keys,
+    # SQLite has no equivalent for arbitrary key paths
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON lnschema_core_paramvalue"
+        " USING GIN (value jsonb_path_ops);"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME};")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lnschema_core", "0073_featurevalue__value_bool_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
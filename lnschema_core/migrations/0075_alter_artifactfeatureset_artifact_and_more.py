@@ -0,0 +1,241 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import lnschema_core.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lnschema_core", "0074_paramvalue_value_gin_index"),
+    ]
+
+    # create the composite indexes before dropping the single-column indexes
+    operations = [
+        migrations.AddIndex(
+            model_name="artifactfeatureset",
+            index=models.Index(
+                fields=["featureset", "artifact"], name="lnschema_co_feature_224a1f_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artifactfeaturevalue",
+            index=models.Index(
+                fields=["featurevalue", "artifact"],
+                name="lnschema_co_feature_604278_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artifactparamvalue",
+            index=models.Index(
+                fields=["paramvalue", "artifact"], name="lnschema_co_paramva_12da43_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artifactulabel",
+            index=models.Index(
+                fields=["ulabel", "artifact"], name="lnschema_co_ulabel__f3e4eb_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="collectionartifact",
+            index=models.Index(
+                fields=["artifact", "collection"], name="lnschema_co_artifac_18ca0f_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="collectionulabel",
+            index=models.Index(
+                fields=["ulabel", "collection"], name="lnschema_co_ulabel__fb267a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="featuresetfeature",
+            index=models.Index(
+                fields=["feature", "featureset"], name="lnschema_co_feature_3ab0c3_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="runparamvalue",
+            index=models.Index(
+                fields=["paramvalue", "run"], name="lnschema_co_paramva_43f5b2_idx"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="artifactfeatureset",
+            name="artifact",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="links_feature_set",
+                to="lnschema_core.artifact",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="artifactfeatureset",
+            name="featureset",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="links_artifact",
+                to="lnschema_core.featureset",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="artifactfeaturevalue",
+            name="artifact",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="lnschema_core.artifact",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="artifactfeaturevalue",
+            name="featurevalue",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="lnschema_core.featurevalue",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="artifactparamvalue",
+            name="artifact",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="lnschema_core.artifact",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="artifactparamvalue",
+            name="paramvalue",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="lnschema_core.paramvalue",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="artifactulabel",
+            name="artifact",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="links_ulabel",
+                to="lnschema_core.artifact",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="artifactulabel",
+            name="ulabel",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="links_artifact",
+                to="lnschema_core.ulabel",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="collectionartifact",
+            name="artifact",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="links_collection",
+                to="lnschema_core.artifact",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="collectionartifact",
+            name="collection",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="links_artifact",
+                to="lnschema_core.collection",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="collectionulabel",
+            name="collection",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="links_ulabel",
+                to="lnschema_core.collection",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="collectionulabel",
+            name="ulabel",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="links_collection",
+                to="lnschema_core.ulabel",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="featuresetfeature",
+            name="feature",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="lnschema_core.feature",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="featuresetfeature",
+            name="featureset",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="lnschema_core.featureset",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="runparamvalue",
+            name="paramvalue",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="lnschema_core.paramvalue",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="runparamvalue",
+            name="run",
+            field=lnschema_core.fields.ForeignKey(
+                blank=True,
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="lnschema_core.run",
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:36
+
+from django.db import migrations, models
+
+import lnschema_core.fields
+
+CHUNK_SIZE = 10_000
+
+
+def populate_positions(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    registry = apps.get_model("lnschema_core", "CollectionArtifact")
+    records = []
+    collection_id, position = None, 0
+    for record in (
+        registry.objects.using(db_alias)
+        .only("id", "collection_id")
+        .order_by("collection_id", "id")
+        .iterator(chunk_size=CHUNK_SIZE)
+    ):
+        if record.collection_id != collection_id:
+            collection_id, position = record.collection_id, 0
+        record.position = position
+        position += 1
+        records.append(record)
+        if len(records) == CHUNK_SIZE:
+            registry.objects.using(db_alias).bulk_update(records, ["position"])
+            records = []
+    registry.objects.using(db_alias).bulk_update(records, ["position"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lnschema_core", "0075_alter_artifactfeatureset_artifact_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="collectionartifact",
+            name="position",
+            field=lnschema_core.fields.IntegerField(
+                blank=True, default=None, null=True
+            ),
+        ),
+        migrations.RunPython(populate_positions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="collectionartifact",
+            index=models.Index(
+                fields=["collection", "position"], name="lnschema_co_collect_8252a0_idx"
+            ),
+        ),
+    ]
@@ -1,42 +1,60 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import re
 import sys
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 # has to be here for the type hinting to work
-from datetime import datetime  # noqa
+from datetime import datetime, timezone
+from functools import cache
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Iterable,
+    Iterator,
     Literal,
     NamedTuple,
+    cast,
+    get_args,
     overload,
 )
 
-from django.db import models
-from django.db.models import CASCADE, PROTECT, Field
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection, models
+from django.db.models import CASCADE, PROTECT, F, Field, Q, Value
 from django.db.models.base import ModelBase
+from django.db.models.fields.json import (
+    KeyTransform,
+    KeyTransformExact,
+    KeyTransformIsNull,
+)
 from django.db.models.fields.related import (
     ManyToManyField,
     ManyToManyRel,
     ManyToOneRel,
 )
+from django.db.models.signals import post_delete
 from lamin_utils import colors
 from lamindb_setup import _check_instance_setup
 from lamindb_setup.core._docs import doc_args
-from lamindb_setup.core.hashing import HASH_LENGTH
+from lamindb_setup.core.hashing import HASH_LENGTH, hash_set, to_b64_str
 
 from lnschema_core.fields import (
     BigIntegerField,
     BooleanField,
     CharField,
     DateTimeField,
+    FloatField,
     ForeignKey,
     IntegerField,
     OneToOneField,
     TextField,
+    arrow_type_alias,
 )
 from lnschema_core.types import (
     ArtifactType,
@@ -61,6 +79,9 @@ if TYPE_CHECKING:
     from lamindb.core import LabelManager
     from lamindb_setup.core.types import UPathStr
     from mudata import MuData
+    from pyarrow import DataType as PyArrowDataType
+    from pyarrow import Schema as PyArrowSchema
+    from pyarrow import Table as PyArrowTable
     from pyarrow.dataset import Dataset as PyArrowDataset
     from tiledbsoma import Collection as SOMACollection
     from tiledbsoma import Experiment as SOMAExperiment
@@ -227,6 +248,36 @@ class TracksUpdates(models.Model):
         super().__init__(*args, **kwargs)
 
 
+class HasTypedValue(models.Model):
+    """Base class for JSON values with typed, range-indexable shadow columns.
+
+    Depending on the `dtype` of the feature or param, the JSON value is copied
+    into one of the typed columns, see :func:`~lnschema_core.models.typed_value_field`.
+    Comparison lookups like "greater than" can then use a b-tree index.
+    """
+
+    class Meta:
+        abstract = True
+
+    _value_float: float | None = FloatField(null=True, default=None)
+    """The value if the dtype is `"num"` or `"float"`."""
+    _value_int: int | None = BigIntegerField(null=True, default=None)
+    """The value if the dtype is `"int"`."""
+    _value_bool: bool | None = BooleanField(null=True, default=None)
+    """The value if the dtype is `"bool"`."""
+    _value_datetime: datetime | None = DateTimeField(null=True, default=None)
+    """The value if the dtype is `"date"` or `"datetime"`."""
+    _value_str: str | None = CharField(max_length=255, null=True, default=None)
+    """The value if the dtype is `"str"` and it has at most 255 characters."""
+
+    def _set_typed_value(self, dtype: str | None) -> None:
+        for field_name in set(TYPED_VALUE_FIELDS.values()):
+            setattr(self, field_name, None)
+        field_name = typed_value_field(dtype)
+        if field_name is not None:
+            setattr(self, field_name, to_typed_value(dtype, self.value))  # type: ignore
+
+
 class CanCurate:
     """Base class providing :class:`~lamindb.core.Record`-based validation."""
 
@@ -726,6 +777,193 @@ class Registry(ModelBase):
         """
         pass
 
+    def iter_df(
+        cls,
+        include: str | list[str] | None = None,
+        chunk_size: int = 10_000,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterate over `pd.DataFrame` chunks.
+
+        Unlike :meth:`~lamindb.core.Record.df`, doesn't materialize the whole
+        registry in memory. Rows are fetched with keyset pagination on `id`.
+        Chunks are indexed by `id` and have a column for every direct field
+        except `updated_at`. Like :meth:`~lamindb.core.Record.filter`, only
+        records with default visibility are returned.
+
+        Args:
+            include: Related fields to include as columns. Takes strings of
+                form `"ulabels__name"`, `"cell_types__name"`, etc. or a list
+                of such strings. Values of many-valued relations are collected
+                into sets.
+            chunk_size: Maximum number of rows per chunk.
+
+        See Also:
+            :meth:`~lamindb.core.Record.df`
+
+        Examples:
+
+            Export all artifacts without loading them into memory at once:
+
+            >>> for df in ln.Artifact.iter_df(include="created_by__handle", chunk_size=50_000):
+            ...     df.to_parquet(f"artifacts_{df.index[0]}.parquet")
+        """
+        import pandas as pd
+
+        if include is None:
+            include = []
+        elif isinstance(include, str):
+            include = [include]
+        pk_name = cls._meta.pk.attname
+        field_names = [
+            field.attname for field in cls._meta.fields if field.name != "updated_at"
+        ]
+        for rows in iter_value_chunks(cls, field_names, chunk_size):
+            df = pd.DataFrame.from_records(rows, columns=field_names).set_index(pk_name)
+            for lookup in include:
+                df[lookup] = related_values(cls, lookup, df.index.tolist())
+            yield df
+
+    def to_arrow(cls, chunk_size: int = 10_000) -> PyArrowTable:
+        """Export to a `pyarrow.Table`.
+
+        Builds `pyarrow.RecordBatch` objects directly from database rows without
+        a round-trip through `pandas`. Columns are the direct fields, foreign
+        keys as `storage_id`, `created_by_id`, etc. Column types are inferred
+        from the registry fields, see :func:`~lnschema_core.fields.arrow_type_alias`,
+        date-times keep their UTC timezone and `JSONField` values are exported
+        as serialized JSON strings. Like :meth:`~lamindb.core.Record.filter`,
+        only records with default visibility are exported.
+
+        Args:
+            chunk_size: Number of rows per record batch.
+
+        See Also:
+            :meth:`~lamindb.core.Record.to_parquet`
+
+        Examples:
+            >>> table = ln.Artifact.to_arrow()
+            >>> table.schema
+        """
+        import pyarrow as pa
+
+        return pa.Table.from_batches(
+            iter_record_batches(cls, chunk_size), schema=arrow_schema(cls)
+        )
+
+    def to_parquet(cls, path: UPathStr, chunk_size: int = 10_000) -> None:
+        """Export to a parquet file.
+
+        Streams the record batches of :meth:`~lamindb.core.Record.to_arrow`
+        into a parquet file so that memory stays bounded by `chunk_size`.
+
+        Args:
+            path: The path of the parquet file.
+            chunk_size: Number of rows per record batch and row group.
+
+        Examples:
+            >>> ln.Artifact.to_parquet("s3://my-bucket/snapshots/artifacts.parquet")
+        """
+        import pyarrow.parquet as pq
+
+        with pq.ParquetWriter(str(path), arrow_schema(cls)) as writer:
+            for batch in iter_record_batches(cls, chunk_size):
+                writer.write_batch(batch)
+
+    def rows(
+        cls, *queries, chunk_size: int = 2000, **expressions
+    ) -> Iterator[RecordRow]:
+        """Iterate over read-only rows.
+
+        A lightweight alternative to iterating over records. Rows carry the same
+        attribute names as records for all direct fields (foreign keys as
+        `storage_id`, `created_by_id`, etc.) and have the same repr. They're
+        constructed without running `__init__` logic or default callables like
+        the one for `created_by`, and need considerably less memory.
+
+        Like :meth:`~lamindb.core.Record.filter`, only returns records with
+        default visibility unless a `visibility` expression is passed. Pass
+        `visibility=None` to also get hidden and trashed records.
+
+        Args:
+            queries: One or multiple `Q` objects.
+            chunk_size: Number of rows fetched from the database cursor at once.
+            expressions: Fields and values passed as Django query expressions.
+
+        Examples:
+            >>> for row in ln.Artifact.rows(suffix=".h5ad"):
+            ...     print(row.uid, row.size)
+        """
+        row_class = get_row_class(cls)
+        expressions = with_default_visibility(cls, expressions)
+        values = cls.objects.filter(*queries, **expressions).values_list(
+            *row_class.__slots__
+        )
+        return (row_class(*row) for row in values.iterator(chunk_size=chunk_size))
+
+    def changes(
+        cls,
+        cursor: str | None = None,
+        *,
+        since: datetime | None = None,
+        limit: int = 1000,
+    ) -> ChangeBatch:
+        """Pull records that changed since a cursor or a point in time.
+
+        Only available for registries that track updates: `Storage`,
+        `Transform`, `Artifact`, `Collection`, `Feature`, `ULabel` and `Param`.
+
+        Changed records are ordered by `(updated_at, id)`, which makes paging
+        through them stable even if many records share a timestamp. Trashed
+        records (`visibility=-1`) are contained in `records`, permanently
+        deleted records are reported via their :class:`~lamindb.core.Tombstone`.
+        Each batch contains at most `limit` records and `limit` tombstones.
+
+        Args:
+            cursor: The cursor of the previous batch. Pass `None` for the first batch.
+            since: Start from this time if no `cursor` is passed.
+            limit: Maximum number of changed records per batch.
+
+        Returns:
+            A :class:`~lamindb.core.ChangeBatch`; pass its `cursor` to the next call.
+
+        Examples:
+            >>> batch = ln.Artifact.changes(since=datetime(2024, 11, 1))
+            >>> while batch.records or batch.tombstones:
+            ...     sync(batch)
+            ...     batch = ln.Artifact.changes(batch.cursor)
+        """
+        if cls not in CHANGE_FEED_REGISTRIES:
+            raise ValueError(f"{cls.__name__} doesn't track updates")
+        updated_at, record_id, tombstone_id = (
+            parse_change_cursor(cursor) if cursor is not None else (since, None, None)
+        )
+        records = cls.objects.order_by("updated_at", "id")
+        tombstones = Tombstone.objects.filter(registry=change_feed_name(cls)).order_by(
+            "id"
+        )
+        if record_id is not None:
+            records = records.filter(
+                Q(updated_at__gt=updated_at)
+                | Q(updated_at=updated_at, id__gt=record_id)
+            )
+        elif updated_at is not None:
+            records = records.filter(updated_at__gte=updated_at)
+        if tombstone_id is not None:
+            tombstones = tombstones.filter(id__gt=tombstone_id)
+        elif updated_at is not None:
+            tombstones = tombstones.filter(created_at__gte=updated_at)
+        records, tombstones = records[:limit], tombstones[:limit]
+        if records:
+            last_record = list(records)[-1]
+            updated_at, record_id = last_record.updated_at, last_record.id
+        if tombstones:
+            tombstone_id = list(tombstones)[-1].id
+        return ChangeBatch(
+            records,
+            tombstones,
+            format_change_cursor(updated_at, record_id, tombstone_id),
+        )
+
     def search(
         cls,
         string: str,
@@ -1249,23 +1487,36 @@ class Param(Record, CanCurate, TracksRun, TracksUpdates):
     """Values for this parameter."""
 
 
-class ParamValue(Record):
+class ParamValue(Record, HasTypedValue):
     """Parameters with values akin to FeatureValue."""
 
     # we do not have a unique constraint on param & value because it leads to hashing errors
     # for large dictionaries: https://lamin.ai/laminlabs/lamindata/transform/jgTrkoeuxAfs0000
-    # we do not hash values because we have `get_or_create` logic all over the place
-    # and also for checking whether the (param, value) combination exists
-    # there does not seem an issue with querying for a dict-like value
-    # https://lamin.ai/laminlabs/lamindata/transform/jgTrkoeuxAfs0001
+    # instead, we store a fixed-length digest of the canonical JSON of the value
+    # and index it together with the param so that `get_or_create` logic doesn't
+    # need to query the JSON field
+    class Meta(HasTypedValue.Meta):
+        abstract = False
+        indexes = [
+            models.Index(fields=["param", "hash"]),
+            models.Index(fields=["param", "_value_float"]),
+            models.Index(fields=["param", "_value_int"]),
+            models.Index(fields=["param", "_value_bool"]),
+            models.Index(fields=["param", "_value_datetime"]),
+            models.Index(fields=["param", "_value_str"]),
+        ]
+
     _name_field: str = "value"
 
-    param: Param = ForeignKey(Param, CASCADE, related_name="values")
+    # the composite indexes above cover lookups by param
+    param: Param = ForeignKey(Param, CASCADE, related_name="values", db_index=False)
     """The dimension metadata."""
     value: Any = (
         models.JSONField()
     )  # stores float, integer, boolean, datetime or dictionaries
     """The JSON-like value."""
+    hash: str | None = CharField(max_length=HASH_LENGTH, null=True)
+    """Hash of the canonical JSON of the value, see :func:`~lnschema_core.models.hash_value`."""
     # it'd be confusing and hard to populate a run here because these
     # values are typically created upon creating a run
     # hence, ParamValue does _not_ inherit from TracksRun but manually
@@ -1278,6 +1529,30 @@ class ParamValue(Record):
     )
     """Creator of record."""
 
+    def save(self, *args, **kwargs) -> ParamValue:
+        """Save."""
+        self.hash = hash_value(self.value)
+        self._set_typed_value(dimension_dtype(self, "param"))
+        return super().save(*args, **kwargs)
+
+    @classmethod
+    def get_or_create_many(cls, param: Param, values: Iterable) -> list[ParamValue]:
+        """Get or create records for many values of a param.
+
+        Existing records are resolved via their hash with one query per 1000
+        distinct values, missing records are bulk-created. If some values
+        aren't found, records without a hash, e.g., created via
+        `objects.bulk_create()`, are hashed and matched, too.
+
+        Returns:
+            One record per value, in the order of `values`.
+
+        Examples:
+            >>> learning_rate = ln.Param.get(name="learning_rate")
+            >>> param_values = ln.ParamValue.get_or_create_many(learning_rate, [0.1, 0.01, 0.1])
+        """
+        return get_or_create_values(cls, "param", param, values)
+
 
 class Run(Record):
     """Runs of transforms.
@@ -1632,6 +1907,8 @@ class Feature(Record, CanCurate, TracksRun, TracksUpdates):
     For categorical types, can define from which registry values are
     sampled, e.g., `'cat[ULabel]'` or `'cat[bionty.CellType]'`. Unions are also
     allowed if the feature samples from two registries, e.g., `'cat[ULabel|bionty.CellType]'`
+
+    Use :func:`~lnschema_core.models.parse_dtype` to get the registries.
     """
     unit: str | None = CharField(max_length=30, db_index=True, null=True)
     """Unit of measure, ideally SI (`m`, `s`, `kg`, etc.) or 'normalized' etc. (optional)."""
@@ -1676,15 +1953,45 @@ class Feature(Record, CanCurate, TracksRun, TracksUpdates):
 
     @classmethod
     def from_df(cls, df: pd.DataFrame, field: FieldAttr | None = None) -> RecordList:
-        """Create Feature records for columns."""
+        """Create Feature records for columns.
+
+        For wide dataframes, consider inferring dtypes via
+        :func:`~lnschema_core.models.infer_feature_dtypes` and resolving existing
+        features via :meth:`~lamindb.Feature.get_existing`, which don't query per
+        column.
+        """
         pass
 
+    @classmethod
+    def get_existing(
+        cls, names: Iterable[str], chunk_size: int = 10_000
+    ) -> dict[str, Feature]:
+        """Get the registered features among these names.
+
+        Runs one query per `chunk_size` names on the indexed `name` field.
+
+        Args:
+            names: Feature names, e.g., the columns of a `DataFrame`.
+            chunk_size: Number of names per query.
+
+        Returns:
+            A dictionary of features keyed by name.
+        """
+        names = list(dict.fromkeys(names))
+        features = {}
+        for start in range(0, len(names), chunk_size):
+            for feature in cls.objects.filter(
+                name__in=names[start : start + chunk_size]
+            ):
+                features[feature.name] = feature
+        return features
+
     def save(self, *args, **kwargs) -> Feature:
         """Save."""
         pass
 
 
-class FeatureValue(Record, TracksRun):
+class FeatureValue(Record, TracksRun, HasTypedValue):
     """Non-categorical features values.
 
     Categorical feature values are stored in their respective registries:
@@ -1696,22 +2003,58 @@ class FeatureValue(Record, TracksRun):
 
     # we do not have a unique constraint on feature & value because it leads to hashing errors
     # for large dictionaries: https://lamin.ai/laminlabs/lamindata/transform/jgTrkoeuxAfs0000
-    # we do not hash values because we have `get_or_create` logic all over the place
-    # and also for checking whether the (feature, value) combination exists
-    # there does not seem an issue with querying for a dict-like value
-    # https://lamin.ai/laminlabs/lamindata/transform/jgTrkoeuxAfs0001
+    # instead, we store a fixed-length digest of the canonical JSON of the value
+    # and index it together with the feature so that `get_or_create` logic doesn't
+    # need to query the JSON field
 
-    class Meta(Record.Meta, TracksRun.Meta):
+    class Meta(Record.Meta, TracksRun.Meta, HasTypedValue.Meta):
         abstract = False
+        indexes = [
+            models.Index(fields=["feature", "hash"]),
+            models.Index(fields=["feature", "_value_float"]),
+            models.Index(fields=["feature", "_value_int"]),
+            models.Index(fields=["feature", "_value_bool"]),
+            models.Index(fields=["feature", "_value_datetime"]),
+            models.Index(fields=["feature", "_value_str"]),
+        ]
 
     _name_field: str = "value"
 
+    # the composite indexes above cover lookups by feature
     feature: Feature | None = ForeignKey(
-        Feature, CASCADE, null=True, related_name="values", default=None
+        Feature, CASCADE, null=True, related_name="values", default=None, db_index=False
     )
     """The dimension metadata."""
     value: Any = models.JSONField()
     """The JSON-like value."""
+    hash: str | None = CharField(max_length=HASH_LENGTH, null=True)
+    """Hash of the canonical JSON of the value, see :func:`~lnschema_core.models.hash_value`."""
+
+    def save(self, *args, **kwargs) -> FeatureValue:
+        """Save."""
+        self.hash = hash_value(self.value)
+        self._set_typed_value(dimension_dtype(self, "feature"))
+        return super().save(*args, **kwargs)
+
+    @classmethod
+    def get_or_create_many(
+        cls, feature: Feature, values: Iterable
+    ) -> list[FeatureValue]:
+        """Get or create records for many values of a feature.
+
+        Existing records are resolved via their hash with one query per 1000
+        distinct values, missing records are bulk-created. If some values
+        aren't found, records without a hash, e.g., created via
+        `objects.bulk_create()`, are hashed and matched, too.
+
+        Returns:
+            One record per value, in the order of `values`.
+
+        Examples:
+            >>> temperature = ln.Feature.get(name="temperature")
+            >>> feature_values = ln.FeatureValue.get_or_create_many(temperature, [37.0, 36.5])
+        """
+        return get_or_create_values(cls, "feature", feature, values)
 
 
 class FeatureSet(Record, TracksRun):
@@ -1889,15 +2232,56 @@ class FeatureSet(Record, TracksRun):
         """Create feature set for validated features."""
         pass
 
+    @classmethod
+    def get_existing(cls, uids: Iterable[str]) -> FeatureSet | None:
+        """Get the feature set with these member uids if it's already registered.
+
+        A single lookup on the unique `hash` field, which is the hash of the set
+        of member uids. The uids must already be known, e.g., because they're
+        stored alongside a panel definition: deriving them from values like gene
+        symbols requires querying the member registry.
+
+        Args:
+            uids: The uids of the members, in any order.
+
+        Examples:
+            >>> feature_set = ln.FeatureSet.get_existing(panel_uids)
+        """
+        return cls.objects.filter(hash=hash_set(set(uids))).first()
+
     def save(self, *args, **kwargs) -> FeatureSet:
         """Save."""
         pass
 
+    def delete(self) -> None:
+        """Delete.
+
+        Also evicts the set from the cache of :attr:`~lamindb.FeatureSet.member_ids`.
+        """
+        evict_member_ids(self._state.db, self.hash)
+        super().delete()
+
     @property
     def members(self) -> QuerySet:
         """A queryset for the individual records of the set."""
         pass
 
+    @property
+    def member_ids(self) -> np.ndarray:
+        """The ids of the members of the set.
+
+        Cached in-process by database and `hash`: a feature set with a hash
+        doesn't change, but its member ids differ across databases.
+        """
+        import numpy as np
+
+        def load() -> np.ndarray:
+            # lamindb's QuerySet is a Django QuerySet
+            members = cast(models.QuerySet, self.members)
+            return np.fromiter(members.values_list("id", flat=True), dtype=np.int64)
+
+        return cached_member_ids(self._state.db, self.hash, load)
+
 
 class Artifact(Record, IsVersioned, TracksRun, TracksUpdates):
     """Datasets & models stored as files, folders, or arrays.
@@ -2586,6 +2970,11 @@ class Collection(Record, IsVersioned, TracksRun, TracksUpdates):
     """A description."""
     hash: str | None = CharField(max_length=HASH_LENGTH, db_index=True, null=True)
     """Hash of collection content. 86 base64 chars allow to store 64 bytes, 512 bits."""
+    _hash_chain: str | None = CharField(max_length=HASH_LENGTH, null=True)
+    """Order-aware hash of the artifact hashes, see :func:`~lnschema_core.models.hash_chain`.
+
+    `None` if it hasn't been computed for the collection.
+    """
     reference: str | None = CharField(max_length=255, db_index=True, null=True)
     """A reference like URL or external ID."""
     # also for reference_type here, we allow an extra long max_length
@@ -2672,6 +3061,22 @@ class Collection(Record, IsVersioned, TracksRun, TracksUpdates):
         """
         pass
 
+    def verify_hash_chain(self) -> bool | None:
+        """Rebuild the hash chain from scratch and compare it to the stored one.
+
+        Returns `True` if the stored hash chain matches the artifacts of the
+        collection ordered by `position`, and `None` if no hash chain is stored.
+        """
+        if self._hash_chain is None:
+            return None
+        artifact_hashes = (
+            CollectionArtifact.objects.using(self._state.db)
+            .filter(collection_id=self.id)
+            .order_by(F("position").asc(nulls_last=True), "id")
+            .values_list("artifact__hash", flat=True)
+        )
+        return hash_chain(artifact_hashes) == self._hash_chain
+
     def mapped(
         self,
         layers_keys: str | list[str] | None = None,
@@ -2807,10 +3212,61 @@ class Collection(Record, IsVersioned, TracksRun, TracksUpdates):
         you non-deterministic order.
 
         Using the property `.ordered_artifacts` allows to iterate through a set
-        that's ordered in the order of creation.
+        that's ordered by the `position` of the artifacts in the collection,
+        which is their order of addition. Links without a `position` come last,
+        ordered by link id.
         """
         pass
 
+    def artifacts_after(
+        self, cursor: tuple[int | None, int] | None = None, limit: int = 1000
+    ) -> QuerySet:
+        """Page through `.ordered_artifacts` using keyset pagination.
+
+        Artifacts are ordered by `position` and then by link id. Links without a
+        `position`, e.g., added by an earlier version of lamindb, come last on
+        every database backend.
+
+        Args:
+            cursor: The `(collection_position, collection_link_id)` of the last
+                artifact of the previous page. Pass `None` to start at the
+                beginning of the collection.
+            limit: Maximum number of artifacts to return.
+
+        Returns:
+            A queryset annotated with `collection_position` and `collection_link_id`.
+
+        Examples:
+            >>> page = list(collection.artifacts_after(limit=1000))
+            >>> while page:
+            ...     process(page)
+            ...     cursor = (page[-1].collection_position, page[-1].collection_link_id)
+            ...     page = list(collection.artifacts_after(cursor, limit=1000))
+        """
+        query = Q(links_collection__collection_id=self.id)
+        if cursor is not None:
+            position, link_id = cursor
+            after_link = Q(links_collection__id__gt=link_id)
+            if position is None:
+                query &= Q(links_collection__position__isnull=True) & after_link
+            else:
+                query &= (
+                    Q(links_collection__position__gt=position)
+                    | Q(links_collection__position=position) & after_link
+                    | Q(links_collection__position__isnull=True)
+                )
+        return (
+            Artifact.objects.using(self._state.db)
+            .filter(query)
+            .annotate(
+                collection_position=F("links_collection__position"),
+                collection_link_id=F("links_collection__id"),
+            )
+            .order_by(
+                F("collection_position").asc(nulls_last=True), "collection_link_id"
+            )[:limit]
+        )
+
     @property
     def data_artifact(self) -> Artifact | None:
         """Access to a single data artifact.
@@ -2836,12 +3292,164 @@ class Collection(Record, IsVersioned, TracksRun, TracksUpdates):
 delattr(Collection, "get_visibility_display")
 
 
+# -------------------------------------------------------------------------------------
+# Change feed
+
+
+class Tombstone(Record):
+    """Permanently deleted records.
+
+    A tombstone is written by a `post_delete` signal handler whenever a record
+    of a registry that tracks updates is permanently deleted so that
+    :meth:`~lamindb.core.Record.changes` can report the deletion to downstream
+    consumers. This includes deletes via querysets.
+    """
+
+    _name_field: str = "record_uid"
+
+    id: int = models.BigAutoField(primary_key=True)
+    """Internal id, valid only in one DB instance."""
+    registry: str = CharField(max_length=120, db_index=True)
+    """The registry of the deleted record, e.g., `'core.Artifact'`."""
+    record_id: int = BigIntegerField(db_index=True)
+    """The internal id of the deleted record."""
+    record_uid: str | None = CharField(max_length=20, db_index=True, null=True)
+    """The universal id of the deleted record, if the registry has one."""
+    created_at: datetime = DateTimeField(auto_now_add=True, db_index=True)
+    """Time of deletion."""
+    created_by: User = ForeignKey(
+        User, PROTECT, default=current_user_id, related_name="+"
+    )
+    """User who deleted the record."""
+
+
+def change_feed_name(registry: Registry) -> str:
+    """Name of a registry in `Tombstone.registry`, e.g., `'core.Artifact'`."""
+    return f"core.{registry.__name__}"
+
+
+def format_change_cursor(
+    updated_at: datetime | None, record_id: int | None, tombstone_id: int | None
+) -> str:
+    """Encode the position in the change feed."""
+    return json.dumps(
+        [
+            None if updated_at is None else updated_at.isoformat(),
+            record_id,
+            tombstone_id,
+        ]
+    )
+
+
+def parse_change_cursor(cursor: str) -> tuple[datetime | None, int | None, int | None]:
+    """Decode the position in the change feed."""
+    updated_at, record_id, tombstone_id = json.loads(cursor)
+    if updated_at is not None:
+        updated_at = datetime.fromisoformat(updated_at)
+    return updated_at, record_id, tombstone_id
+
+
+def write_tombstone(sender: Registry, instance: Record, using: str, **kwargs) -> None:
+    """Record the permanent deletion of a record for the change feed."""
+    Tombstone.objects.using(using).create(
+        registry=change_feed_name(sender),
+        record_id=instance.pk,
+        record_uid=getattr(instance, "uid", None),
+    )
+
+
+class ChangeBatch(NamedTuple):
+    """A batch of the change feed, see :meth:`~lamindb.core.Record.changes`."""
+
+    records: QuerySet
+    """Changed records ordered by `(updated_at, id)`."""
+    tombstones: QuerySet
+    """Tombstones of permanently deleted records."""
+    cursor: str
+    """Opaque cursor to resume the feed after this batch."""
+
+
 # -------------------------------------------------------------------------------------
 # Link models
+#
+# Link models don't index their foreign keys individually: the unique constraint
+# covers lookups in one direction and a composite index in reverse order covers
+# lookups in the other direction, e.g., "all artifacts with ulabel X"
 
 
 class LinkORM:
-    pass
+    @classmethod
+    def bulk_link(
+        cls, chunk_size: int = 10_000, check_existing: bool = True, **links: Iterable
+    ) -> int:
+        """Bulk create links from arrays of records or ids.
+
+        Pass one array per foreign key of the link model, all of the same
+        length. Duplicates and existing links are skipped with one query per
+        chunk, the remaining links are inserted via `bulk_create`. Creating user
+        and run are resolved once rather than once per link.
+
+        Args:
+            chunk_size: Number of links per query and insert.
+            check_existing: Whether to query for existing links. Pass `False` if
+                none can exist, e.g., for the members of a newly saved feature set.
+            links: Arrays of records or ids keyed by foreign key field name.
+
+        Returns:
+            The number of created links.
+
+        Raises:
+            IntegrityError: If `check_existing=False` and a link already exists.
+
+        Examples:
+            >>> ln.models.ArtifactULabel.bulk_link(
+            ...     artifact=artifact_ids, ulabel=ulabel_ids, feature=feature_ids
+            ... )
+        """
+        field_names = list(links)
+        attnames = [cls._meta.get_field(name).attname for name in field_names]  # type: ignore
+        columns = [
+            [getattr(value, "pk", value) for value in values]
+            for values in links.values()
+        ]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError(
+                "All arrays of records or ids need to have the same length"
+            )
+        rows = list(dict.fromkeys(zip(*columns)))
+        defaults = {}
+        field_names_all = {field.name for field in cls._meta.fields}  # type: ignore
+        if "created_by" in field_names_all and "created_by" not in links:
+            defaults["created_by_id"] = current_user_id()
+        if "run" in field_names_all and "run" not in links:
+            run = current_run()
+            defaults["run_id"] = None if run is None else run.id
+        n_created = 0
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            if not check_existing:
+                cls.objects.bulk_create(  # type: ignore
+                    [cls(**dict(zip(attnames, row)), **defaults) for row in chunk]
+                )
+                n_created += len(chunk)
+                continue
+            query = Q()
+            for i, attname in enumerate(attnames):
+                values = {row[i] for row in chunk}
+                condition = Q(**{f"{attname}__in": values - {None}})
+                if None in values:
+                    condition |= Q(**{f"{attname}__isnull": True})
+                query &= condition
+            existing = set(
+                cls.objects.filter(query).values_list(*attnames)  # type: ignore
+            )
+            new_rows = [row for row in chunk if row not in existing]
+            cls.objects.bulk_create(  # type: ignore
+                [cls(**dict(zip(attnames, row)), **defaults) for row in new_rows],
+                ignore_conflicts=True,
+            )
+            n_created += len(new_rows)
+        return n_created
 
 
 class ValidateFields:
@@ -2851,19 +3459,24 @@ class ValidateFields:
 class FeatureSetFeature(Record, LinkORM):
     id: int = models.BigAutoField(primary_key=True)
     # we follow the lower() case convention rather than snake case for link models
-    featureset: FeatureSet = ForeignKey(FeatureSet, CASCADE, related_name="+")
-    feature: Feature = ForeignKey(Feature, PROTECT, related_name="+")
+    featureset: FeatureSet = ForeignKey(
+        FeatureSet, CASCADE, related_name="+", db_index=False
+    )
+    feature: Feature = ForeignKey(Feature, PROTECT, related_name="+", db_index=False)
 
     class Meta:
         unique_together = ("featureset", "feature")
+        indexes = [models.Index(fields=["feature", "featureset"])]
 
 
 class ArtifactFeatureSet(Record, LinkORM, TracksRun):
     id: int = models.BigAutoField(primary_key=True)
-    artifact: Artifact = ForeignKey(Artifact, CASCADE, related_name="links_feature_set")
+    artifact: Artifact = ForeignKey(
+        Artifact, CASCADE, related_name="links_feature_set", db_index=False
+    )
     # we follow the lower() case convention rather than snake case for link models
     featureset: FeatureSet = ForeignKey(
-        FeatureSet, PROTECT, related_name="links_artifact"
+        FeatureSet, PROTECT, related_name="links_artifact", db_index=False
     )
     slot: str | None = CharField(max_length=40, null=True)
     feature_ref_is_semantic: bool | None = BooleanField(
@@ -2872,23 +3485,36 @@ class ArtifactFeatureSet(Record, LinkORM, TracksRun):
 
     class Meta:
         unique_together = ("artifact", "featureset")
+        indexes = [models.Index(fields=["featureset", "artifact"])]
 
 
 class CollectionArtifact(Record, LinkORM, TracksRun):
     id: int = models.BigAutoField(primary_key=True)
     collection: Collection = ForeignKey(
-        Collection, CASCADE, related_name="links_artifact"
+        Collection, CASCADE, related_name="links_artifact", db_index=False
     )
-    artifact: Artifact = ForeignKey(Artifact, PROTECT, related_name="links_collection")
+    artifact: Artifact = ForeignKey(
+        Artifact, PROTECT, related_name="links_collection", db_index=False
+    )
+    position: int | None = IntegerField(null=True, default=None)
+    """Position of the artifact in the collection, starting at 0."""
 
     class Meta:
         unique_together = ("collection", "artifact")
+        indexes = [
+            models.Index(fields=["artifact", "collection"]),
+            models.Index(fields=["collection", "position"]),
+        ]
 
 
 class ArtifactULabel(Record, LinkORM, TracksRun):
     id: int = models.BigAutoField(primary_key=True)
-    artifact: Artifact = ForeignKey(Artifact, CASCADE, related_name="links_ulabel")
-    ulabel: ULabel = ForeignKey(ULabel, PROTECT, related_name="links_artifact")
+    artifact: Artifact = ForeignKey(
+        Artifact, CASCADE, related_name="links_ulabel", db_index=False
+    )
+    ulabel: ULabel = ForeignKey(
+        ULabel, PROTECT, related_name="links_artifact", db_index=False
+    )
     feature: Feature | None = ForeignKey(
         Feature, PROTECT, null=True, related_name="links_artifactulabel", default=None
     )
@@ -2899,14 +3525,17 @@ class ArtifactULabel(Record, LinkORM, TracksRun):
         # can have the same label linked to the same artifact if the feature is
         # different
         unique_together = ("artifact", "ulabel", "feature")
+        indexes = [models.Index(fields=["ulabel", "artifact"])]
 
 
 class CollectionULabel(Record, LinkORM, TracksRun):
     id: int = models.BigAutoField(primary_key=True)
     collection: Collection = ForeignKey(
-        Collection, CASCADE, related_name="links_ulabel"
+        Collection, CASCADE, related_name="links_ulabel", db_index=False
+    )
+    ulabel: ULabel = ForeignKey(
+        ULabel, PROTECT, related_name="links_collection", db_index=False
     )
-    ulabel: ULabel = ForeignKey(ULabel, PROTECT, related_name="links_collection")
     feature: Feature | None = ForeignKey(
         Feature, PROTECT, null=True, related_name="links_collectionulabel", default=None
     )
@@ -2915,36 +3544,44 @@ class CollectionULabel(Record, LinkORM, TracksRun):
 
     class Meta:
         unique_together = ("collection", "ulabel")
+        indexes = [models.Index(fields=["ulabel", "collection"])]
 
 
 class ArtifactFeatureValue(Record, LinkORM, TracksRun):
     id: int = models.BigAutoField(primary_key=True)
-    artifact: Artifact = ForeignKey(Artifact, CASCADE, related_name="+")
+    artifact: Artifact = ForeignKey(Artifact, CASCADE, related_name="+", db_index=False)
     # we follow the lower() case convention rather than snake case for link models
-    featurevalue = ForeignKey(FeatureValue, PROTECT, related_name="+")
+    featurevalue = ForeignKey(FeatureValue, PROTECT, related_name="+", db_index=False)
 
     class Meta:
         unique_together = ("artifact", "featurevalue")
+        indexes = [models.Index(fields=["featurevalue", "artifact"])]
 
 
 class RunParamValue(Record, LinkORM):
     id: int = models.BigAutoField(primary_key=True)
-    run: Run = ForeignKey(Run, CASCADE, related_name="+")
+    run: Run = ForeignKey(Run, CASCADE, related_name="+", db_index=False)
     # we follow the lower() case convention rather than snake case for link models
-    paramvalue: ParamValue = ForeignKey(ParamValue, PROTECT, related_name="+")
+    paramvalue: ParamValue = ForeignKey(
+        ParamValue, PROTECT, related_name="+", db_index=False
+    )
 
     class Meta:
         unique_together = ("run", "paramvalue")
+        indexes = [models.Index(fields=["paramvalue", "run"])]
 
 
 class ArtifactParamValue(Record, LinkORM):
     id: int = models.BigAutoField(primary_key=True)
-    artifact: Artifact = ForeignKey(Artifact, CASCADE, related_name="+")
+    artifact: Artifact = ForeignKey(Artifact, CASCADE, related_name="+", db_index=False)
     # we follow the lower() case convention rather than snake case for link models
-    paramvalue: ParamValue = ForeignKey(ParamValue, PROTECT, related_name="+")
+    paramvalue: ParamValue = ForeignKey(
+        ParamValue, PROTECT, related_name="+", db_index=False
+    )
 
     class Meta:
         unique_together = ("artifact", "paramvalue")
+        indexes = [models.Index(fields=["paramvalue", "artifact"])]
 
 
 # class Migration(Record):
@@ -2981,6 +3618,345 @@ def format_field_value(value: datetime | str | Any) -> Any:
         return value
 
 
+def hash_value(value: Any) -> str:
+    """Hash of the canonical JSON of a `FeatureValue` or `ParamValue` value.
+
+    Dictionary keys are sorted, whitespace is stripped and integral floats are
+    written as integers so that equal values always have the same hash, as under
+    `jsonb` equality on Postgres.
+    """
+
+    def normalize(value: Any) -> Any:
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, dict):
+            return {key: normalize(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [normalize(item) for item in value]
+        return value
+
+    canonical = json.dumps(
+        normalize(value), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return to_b64_str(hashlib.md5(canonical.encode()).digest())[:HASH_LENGTH]
+
+
+def json_contains(value: dict, field: str = "value", vendor: str | None = None) -> Q:
+    """Index-friendly containment lookup for dict-like JSON values.
+
+    On Postgres, translates to the `@>` operator, which can use the
+    `jsonb_path_ops` GIN index on `ParamValue.value`. On other backends, the
+    dictionary is flattened into one exact lookup per nested key path; lists
+    are then compared for equality rather than containment and empty nested
+    dictionaries only require the key to be present. Integer-like keys aren't
+    supported on these backends because key paths interpret them as array
+    indices.
+
+    Args:
+        value: The nested dictionary that the JSON value should contain.
+        field: The name of the JSON field.
+        vendor: The database vendor, defaults to the one of the default connection.
+
+    Raises:
+        ValueError: If a key is integer-like on a backend other than Postgres.
+
+    Examples:
+        >>> ln.ParamValue.filter(json_contains({"optimizer": {"name": "adam"}}))
+    """
+    if vendor is None:
+        vendor = connection.vendor
+    if vendor == "postgresql":
+        return Q(**{f"{field}__contains": value})
+
+    # key transforms are chained explicitly so that keys like "lt" or "in" aren't
+    # read as lookups
+    def flatten(
+        lhs: F | KeyTransform, value: dict
+    ) -> Iterator[KeyTransformExact | KeyTransformIsNull]:
+        for key, item in value.items():
+            try:
+                int(key)
+            except ValueError:
+                pass
+            else:
+                raise ValueError(
+                    f"Integer-like key {key!r} isn't supported on {vendor}"
+                ) from None
+            key_transform = KeyTransform(key, lhs)
+            if isinstance(item, dict) and item:
+                yield from flatten(key_transform, item)
+            elif isinstance(item, dict):
+                # an exact lookup would only match empty dictionaries
+                yield KeyTransformIsNull(key_transform, False)
+            else:
+                yield KeyTransformExact(
+                    key_transform, Value(item, output_field=models.JSONField())
+                )
+
+    return Q(*flatten(F(field), value))
+
+
+TYPED_VALUE_FIELDS = {
+    "num": "_value_float",
+    "float": "_value_float",
+    "int": "_value_int",
+    "bool": "_value_bool",
+    "date": "_value_datetime",
+    "datetime": "_value_datetime",
+    "str": "_value_str",
+}
+
+
+def typed_value_field(dtype: str | None) -> str | None:
+    """The typed shadow column of `FeatureValue` & `ParamValue` for a dtype.
+
+    Returns `None` for dtypes without a typed column, e.g., `"object"`.
+
+    Comparison lookups on values should be routed to this column, e.g.,
+    `value__gt=37` becomes `_value_float__gt=37.0` for a `"num"` feature.
+    Pass the compared value through :func:`~lnschema_core.models.to_typed_value`.
+    """
+    return TYPED_VALUE_FIELDS.get(dtype)  # type: ignore
+
+
+def to_typed_value(dtype: str | None, value: Any) -> Any:
+    """Cast a JSON value to the type of its typed column, `None` if not castable."""
+    field_name = typed_value_field(dtype)
+    if field_name is None or value is None or isinstance(value, (dict, list)):
+        return None
+    if field_name == "_value_bool":
+        return value if isinstance(value, bool) else None
+    if isinstance(value, bool):
+        return None
+    try:
+        if field_name == "_value_float":
+            return float(value)
+        if field_name == "_value_int":
+            if isinstance(value, float) and not value.is_integer():
+                return None
+            return int(value)
+        if field_name == "_value_datetime":
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, datetime):
+                # a date
+                value = datetime(value.year, value.month, value.day)
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value
+    except (AttributeError, TypeError, ValueError):
+        return None
+    value = str(value)
+    return value if len(value) <= 255 else None
+
+
+dimension_dtype_cache: dict[tuple[str, type[Record], int], str | None] = {}
+
+
+def dimension_dtype(record: HasTypedValue, field_name: str) -> str | None:
+    """The dtype of the feature or param of a value.
+
+    Uses the related record if it's already fetched, otherwise looks up the
+    dtype by foreign key once per process. The dtype of a feature or param with
+    values doesn't change.
+    """
+    field = record._meta.get_field(field_name)
+    if field.is_cached(record):  # type: ignore
+        dimension = getattr(record, field_name)
+        return None if dimension is None else dimension.dtype
+    dimension_id = getattr(record, field.attname)  # type: ignore
+    if dimension_id is None:
+        return None
+    db = record._state.db or "default"
+    key = (db, field.related_model, dimension_id)
+    if key not in dimension_dtype_cache:
+        dimension_dtype_cache[key] = (
+            field.related_model.objects.using(db)  # type: ignore
+            .values_list("dtype", flat=True)
+            .get(id=dimension_id)
+        )
+    return dimension_dtype_cache[key]
+
+
+def get_or_create_values(
+    registry: type[FeatureValue] | type[ParamValue],
+    dimension_field: str,
+    dimension: Feature | Param,
+    values: Iterable,
+    chunk_size: int = 1000,
+) -> list:
+    values = list(values)
+    hashes = [hash_value(value) for value in values]
+    unique_hashes = list(dict.fromkeys(hashes))
+    records: dict[str, FeatureValue | ParamValue] = {}
+    for start in range(0, len(unique_hashes), chunk_size):
+        for record in registry.objects.filter(
+            **{dimension_field: dimension},
+            hash__in=unique_hashes[start : start + chunk_size],
+        ):
+            records.setdefault(record.hash, record)
+    if len(records) < len(unique_hashes):
+        # records created via bulk_create() elsewhere don't have a hash
+        unhashed_records = []
+        for record in registry.objects.filter(
+            **{dimension_field: dimension}, hash__isnull=True
+        ).iterator(chunk_size=chunk_size):
+            record.hash = hash_value(record.value)
+            record._set_typed_value(dimension.dtype)
+            records.setdefault(record.hash, record)
+            unhashed_records.append(record)
+        registry.objects.bulk_update(
+            unhashed_records,
+            ["hash", *set(TYPED_VALUE_FIELDS.values())],
+            batch_size=chunk_size,
+        )
+    new_records: dict[str, FeatureValue | ParamValue] = {}
+    for value, hash in zip(values, hashes):
+        if hash not in records and hash not in new_records:
+            new_records[hash] = registry(  # type: ignore
+                **{dimension_field: dimension}, value=value, hash=hash
+            )
+            # bulk_create doesn't call save()
+            new_records[hash]._set_typed_value(dimension.dtype)
+    registry.objects.bulk_create(new_records.values(), batch_size=chunk_size)
+    records.update(new_records)
+    return [records[hash] for hash in hashes]
+
+
+def hash_chain_append(chain: str | None, artifact_hash: str | None) -> str:
+    """Extend the hash chain of a collection by the hash of an appended artifact."""
+    previous = b"" if chain is None else chain.encode()
+    current = b"" if artifact_hash is None else artifact_hash.encode()
+    return to_b64_str(hashlib.md5(previous + b":" + current).digest())[:HASH_LENGTH]
+
+
+def hash_chain(artifact_hashes: Iterable[str | None]) -> str | None:
+    """Hash chain of a sequence of artifact hashes, `None` if it's empty."""
+    result = None
+    for artifact_hash in artifact_hashes:
+        result = hash_chain_append(result, artifact_hash)
+    return result
+
+
+def feature_dtype(dtype: Any, str_as_cat: bool = True) -> FeatureDtype:
+    """The `FeatureDtype` of a pandas or NumPy dtype."""
+    from pandas.api import types
+
+    if isinstance(dtype, types.CategoricalDtype):
+        return "cat"
+    if types.is_bool_dtype(dtype):
+        return "bool"
+    if types.is_integer_dtype(dtype):
+        return "int"
+    if types.is_float_dtype(dtype):
+        return "float"
+    if types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if types.is_string_dtype(dtype):
+        return "cat" if str_as_cat else "str"
+    return "object"
+
+
+def infer_feature_dtypes(df: pd.DataFrame, str_as_cat: bool = True) -> pd.Series:
+    """The `FeatureDtype` of each column of a `DataFrame`.
+
+    Each distinct dtype is mapped once, so that wide frames only cost a
+    factorization of `df.dtypes`.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, dtypes = pd.factorize(df.dtypes)
+    feature_dtypes = np.array(
+        [feature_dtype(dtype, str_as_cat) for dtype in dtypes], dtype=object
+    )
+    return pd.Series(feature_dtypes[codes], index=df.columns, dtype=object)
+
+
+CAT_DTYPE_PATTERN = re.compile(r"^cat(?:\[([^\[\]]*)\])?$")
+
+
+class ParsedDtype(NamedTuple):
+    """A parsed `Feature.dtype`, see :func:`~lnschema_core.models.parse_dtype`."""
+
+    base: FeatureDtype
+    """The base type, e.g., `"cat"` for `"cat[ULabel|bionty.CellType]"`."""
+    registries: tuple[Registry, ...]
+    """The registries of a categorical type, e.g., `(ULabel, bionty.CellType)`."""
+
+
+def parse_dtype(dtype: str) -> ParsedDtype:
+    """Parse a `Feature.dtype` string like `"cat[ULabel|bionty.CellType]"`.
+
+    Registries are resolved through the Django app registry, so no modules are
+    imported. Results are memoized per string and per set of loaded schema
+    modules.
+
+    Raises:
+        ValueError: If the dtype is invalid or references an unknown registry.
+
+    Examples:
+        >>> parsed = parse_dtype("cat[ULabel|bionty.CellType]")
+        >>> parsed.base
+        'cat'
+        >>> [registry.__name__ for registry in parsed.registries]
+        ['ULabel', 'CellType']
+    """
+    return parse_dtype_for_schema(dtype, frozenset(apps.app_configs))
+
+
+@cache
+def parse_dtype_for_schema(dtype: str, schema: frozenset[str]) -> ParsedDtype:
+    """Memoized implementation of :func:`~lnschema_core.models.parse_dtype`."""
+    if dtype in get_args(FeatureDtype):
+        return ParsedDtype(dtype, ())  # type: ignore
+    match = CAT_DTYPE_PATTERN.match(dtype)
+    if match is None:
+        raise ValueError(f"Invalid dtype: {dtype}")
+    registries = []
+    for name in (match.group(1) or "").split("|"):
+        name = name.strip()
+        if not name:
+            continue
+        module_name, _, model_name = name.rpartition(".")
+        if module_name in {"", "core"}:
+            module_name = "lnschema_core"
+        if module_name not in schema:
+            raise ValueError(f"Module {module_name} of dtype {dtype} is not loaded")
+        try:
+            registries.append(apps.get_model(module_name, model_name))
+        except LookupError as e:
+            raise ValueError(f"Unknown registry {name} in dtype {dtype}") from e
+    return ParsedDtype("cat", tuple(registries))
+
+
+MEMBER_IDS_CACHE_SIZE = 128
+member_ids_cache: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+
+
+def cached_member_ids(
+    db: str | None, hash: str | None, load: Callable[[], np.ndarray]
+) -> np.ndarray:
+    """Member ids of a feature set from an LRU cache keyed by database alias and `FeatureSet.hash`."""
+    if db is None or hash is None:
+        return load()
+    key = (db, hash)
+    if key in member_ids_cache:
+        member_ids_cache.move_to_end(key)
+        return member_ids_cache[key]
+    ids = load()
+    ids.flags.writeable = False
+    member_ids_cache[key] = ids
+    if len(member_ids_cache) > MEMBER_IDS_CACHE_SIZE:
+        member_ids_cache.popitem(last=False)
+    return ids
+
+
+def evict_member_ids(db: str | None, hash: str | None) -> None:
+    """Remove a feature set from the member ids cache."""
+    member_ids_cache.pop((db, hash), None)  # type: ignore
+
+
 class RegistryInfo:
     def __init__(self, registry: Registry):
         self.registry = registry
@@ -3203,6 +4179,164 @@ def record_repr(
     return f"{self.__class__.__name__}({fields_joined_str})"
 
 
+class RecordRow:
+    """Base class for read-only rows, see :meth:`~lamindb.core.Record.rows`.
+
+    Rows store the values of the direct fields of a record in `__slots__` and
+    skip Django's model instantiation.
+    """
+
+    __slots__: tuple[str, ...] = ()
+    _meta: Any
+
+    def __init__(self, *values):
+        for attname, value in zip(self.__slots__, values):
+            object.__setattr__(self, attname, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} row is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RecordRow) or other._meta is not self._meta:
+            return NotImplemented
+        return all(
+            getattr(self, attname) == getattr(other, attname)
+            for attname in self.__slots__
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._meta.label, getattr(self, self._meta.pk.attname)))
+
+    __repr__ = record_repr
+    __str__ = record_repr
+
+
+row_class_cache: dict[Registry, type[RecordRow]] = {}
+
+
+def iter_value_chunks(
+    registry: Registry, field_names: list[str], chunk_size: int
+) -> Iterator[list[tuple]]:
+    """Iterate over chunks of value tuples using keyset pagination on the pk."""
+    pk_name = registry._meta.pk.attname
+    pk_index = field_names.index(pk_name)
+    queryset = registry.objects.filter(
+        **with_default_visibility(registry, {})
+    ).order_by(pk_name)
+    last_pk = None
+    while True:
+        if last_pk is not None:
+            chunk_queryset = queryset.filter(**{f"{pk_name}__gt": last_pk})
+        else:
+            chunk_queryset = queryset
+        rows = list(chunk_queryset.values_list(*field_names)[:chunk_size])
+        if rows:
+            yield rows
+        if len(rows) < chunk_size:
+            return
+        last_pk = rows[-1][pk_index]
+
+
+def arrow_type(field: Field) -> PyArrowDataType:
+    """Arrow type of a field, date-times are timezone-aware in UTC."""
+    import pyarrow as pa
+
+    if field.get_internal_type() == "DateTimeField":
+        return pa.timestamp("us", tz="UTC")
+    return pa.type_for_alias(arrow_type_alias(field))
+
+
+def arrow_schema(registry: Registry) -> PyArrowSchema:
+    """Arrow schema with one column per direct field of a registry."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [(field.attname, arrow_type(field)) for field in registry._meta.fields]
+    )
+
+
+def iter_record_batches(registry: Registry, chunk_size: int) -> Iterator:
+    """Iterate over `pyarrow.RecordBatch` objects of all direct fields."""
+    import pyarrow as pa
+
+    schema = arrow_schema(registry)
+    fields = registry._meta.fields
+    for rows in iter_value_chunks(
+        registry, [field.attname for field in fields], chunk_size
+    ):
+        columns = []
+        for i, field in enumerate(fields):
+            values = [row[i] for row in rows]
+            if field.get_internal_type() == "JSONField":
+                values = [
+                    None if value is None else json.dumps(value) for value in values
+                ]
+            elif pa.types.is_string(schema.field(i).type):
+                values = [None if value is None else str(value) for value in values]
+            columns.append(pa.array(values, type=schema.field(i).type))
+        yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def is_many_valued(registry: Registry, lookup: str) -> bool:
+    """Whether a lookup like `"ulabels__name"` traverses a many-valued relation."""
+    model = registry
+    for name in lookup.split("__"):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        if not field.is_relation:
+            return False
+        if field.many_to_many or field.one_to_many:
+            return True
+        model = field.related_model
+    return False
+
+
+def related_values(registry: Registry, lookup: str, pks: list) -> list:
+    """Values of a related field for records, as sets for many-valued relations."""
+    pk_name = registry._meta.pk.attname
+    queryset = registry.objects.filter(**{f"{pk_name}__in": pks}).values_list(
+        pk_name, lookup
+    )
+    if is_many_valued(registry, lookup):
+        value_sets: dict[Any, set] = defaultdict(set)
+        for pk, value in queryset:
+            if value is not None:
+                value_sets[pk].add(value)
+        return [value_sets[pk] for pk in pks]
+    values = dict(queryset)
+    return [values.get(pk) for pk in pks]
+
+
+def with_default_visibility(registry: Registry, expressions: dict) -> dict:
+    """Add the default visibility filter of `Record.filter` to expressions."""
+    if not any(field.name == "visibility" for field in registry._meta.fields):
+        return expressions
+    if any(key.split("__")[0] == "visibility" for key in expressions):
+        if expressions.get("visibility", VisibilityChoice.default) is None:
+            expressions = dict(expressions)
+            expressions.pop("visibility")
+        return expressions
+    return {**expressions, "visibility": VisibilityChoice.default}
+
+
+def get_row_class(registry: Registry) -> type[RecordRow]:
+    """Row class of a registry with one slot per direct field."""
+    if registry not in row_class_cache:
+        # same class name as the registry so that the repr matches record_repr
+        row_class_cache[registry] = type(
+            registry.__name__,
+            (RecordRow,),
+            {
+                "__slots__": tuple(field.attname for field in registry._meta.fields),
+                "__module__": registry.__module__,
+                "_meta": registry._meta,
+            },
+        )
+    return row_class_cache[registry]
+
+
 # below is code to further format the repr of a record
 #
 # def format_repr(
@@ -3221,6 +4355,20 @@ def record_repr(
 Record.__repr__ = record_repr  # type: ignore
 Record.__str__ = record_repr  # type: ignore
 
+CHANGE_FEED_REGISTRIES = (
+    Storage,
+    Transform,
+    Artifact,
+    Collection,
+    Feature,
+    ULabel,
+    Param,
+)
+for registry in CHANGE_FEED_REGISTRIES:
+    post_delete.connect(
+        write_tombstone, sender=registry, dispatch_uid=f"tombstone_{registry.__name__}"
+    )
+
 
 def deferred_attribute__repr__(self):
     return f"FieldAttr({self.field.model.__name__}.{self.field.name})"
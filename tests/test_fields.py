@@ -0,0 +1,18 @@
+from django.db import models
+from lnschema_core import fields
+from lnschema_core.fields import arrow_type_alias
+
+
+def test_arrow_type_alias():
+    assert arrow_type_alias(fields.BigIntegerField()) == "int64"
+    assert arrow_type_alias(fields.DateTimeField()) == "timestamp[us]"
+    assert arrow_type_alias(fields.JSONField()) == "string"
+    assert arrow_type_alias(fields.CharField()) == "string"
+    assert arrow_type_alias(models.SmallIntegerField()) == "int16"
+
+
+def test_arrow_type_alias_relational(setup_instance):
+    import lnschema_core.models as ln
+
+    assert arrow_type_alias(ln.Artifact._meta.get_field("storage")) == "int32"
+    assert arrow_type_alias(ln.Run._meta.get_field("parent")) == "int64"
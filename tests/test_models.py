@@ -1,6 +1,9 @@
 import re
 import textwrap
 
+import pytest
+from django.db import models
+
 
 def _strip_ansi(text: str) -> str:
     """Remove ANSI escape sequences from a string."""
@@ -8,6 +11,14 @@ def _strip_ansi(text: str) -> str:
     return ansi_escape.sub("", text)
 
 
+def _create_record(registry, /, **kwargs):
+    """Create a record without the __init__ and save() that lamindb implements."""
+    record = registry.__new__(registry)
+    models.Model.__init__(record, **kwargs)
+    models.Model.save(record)
+    return record
+
+
 def test_registry__repr__param(setup_instance):
     import lnschema_core.models as ln
 
@@ -65,3 +76,469 @@ def test_registry__repr__artifact(setup_instance):
     actual_repr = _strip_ansi(repr(artifact))
     print(actual_repr)
     assert actual_repr.strip() == expected_repr.strip()
+
+
+def test_registry_rows(setup_instance):
+    import lnschema_core.models as ln
+
+    user = ln.User.objects.first()
+    row = next(ln.User.rows(uid=user.uid))
+    assert row.handle == user.handle
+    assert row.__class__.__name__ == "User"
+    assert _strip_ansi(repr(row)) == _strip_ansi(repr(user))
+    assert not hasattr(row, "__dict__")
+    with pytest.raises(AttributeError):
+        row.handle = "other"
+
+
+def test_with_default_visibility(setup_instance):
+    import lnschema_core.models as ln
+    from lnschema_core.models import with_default_visibility
+
+    assert with_default_visibility(ln.User, {"handle": "a"}) == {"handle": "a"}
+    assert with_default_visibility(ln.Artifact, {"suffix": ".h5ad"}) == {
+        "suffix": ".h5ad",
+        "visibility": 1,
+    }
+    assert with_default_visibility(ln.Artifact, {"visibility": -1}) == {
+        "visibility": -1
+    }
+    assert with_default_visibility(ln.Artifact, {"visibility__in": [0, 1]}) == {
+        "visibility__in": [0, 1]
+    }
+    assert with_default_visibility(ln.Artifact, {"visibility": None}) == {}
+
+
+def test_registry_iter_df(setup_instance):
+    import lnschema_core.models as ln
+    import pandas as pd
+
+    params = [
+        ln.Param(name=f"iter_df_param_{i}", dtype="int", run=None) for i in range(5)
+    ]
+    for param in params:
+        param.save()
+    ln.ParamValue(param=params[0], value=1).save()
+    ln.ParamValue(param=params[0], value=2).save()
+    ids = [param.id for param in params]
+    dfs = list(
+        ln.Param.iter_df(include=["created_by__handle", "values__value"], chunk_size=2)
+    )
+    # other tests may have registered params, too
+    assert [len(df) for df in dfs[:-1]] == [2] * (len(dfs) - 1)
+    assert sum(len(df) for df in dfs) == ln.Param.objects.count()
+    assert all(df.index.name == "id" for df in dfs)
+    assert "updated_at" not in dfs[0].columns
+    df = pd.concat(dfs)
+    assert df.index.is_monotonic_increasing
+    assert df.loc[ids[0], "name"] == "iter_df_param_0"
+    assert df.loc[ids[0], "created_by__handle"] == ln.User.objects.first().handle
+    assert df.loc[ids[0], "values__value"] == {1, 2}
+    assert df.loc[ids[1], "values__value"] == set()
+    ln.Param.objects.filter(id__in=ids).delete()
+
+
+def test_registry_to_arrow(setup_instance, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import lnschema_core.models as ln
+    import pyarrow.parquet as pq
+
+    param = ln.Param(name="to_arrow_param", dtype="int", run=None)
+    param.save()
+    ln.ParamValue(param=param, value={"lr": 0.1}).save()
+    table = ln.ParamValue.to_arrow(chunk_size=1)
+    assert pa.types.is_integer(table.schema.field("param_id").type)
+    assert table.schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+    assert table.schema.field("value").type == pa.string()
+    row = table.filter(pa.compute.equal(table["param_id"], param.id)).to_pylist()[0]
+    assert row["value"] == '{"lr": 0.1}'
+    path = tmp_path / "paramvalues.parquet"
+    ln.ParamValue.to_parquet(path, chunk_size=1)
+    assert pq.read_table(path).equals(table)
+    ln.ParamValue.objects.filter(param=param).delete()
+    ln.Param.objects.filter(id=param.id).delete()
+
+
+def test_registry_changes(setup_instance):
+    import lnschema_core.models as ln
+
+    cursor = ln.Param.changes(limit=10_000).cursor
+    params = [
+        ln.Param(name=f"changes_param_{i}", dtype="int", run=None) for i in range(2)
+    ]
+    for param in params:
+        param.save()
+    batch = ln.Param.changes(cursor, limit=1)
+    assert list(batch.records) == params[:1]
+    batch = ln.Param.changes(batch.cursor, limit=1)
+    assert list(batch.records) == params[1:]
+    assert list(batch.tombstones) == []
+    ids = [param.id for param in params]
+    ln.Param.objects.filter(id__in=ids).delete()
+    batch = ln.Param.changes(batch.cursor)
+    assert list(batch.records) == []
+    assert sorted(tombstone.record_id for tombstone in batch.tombstones) == ids
+    assert {tombstone.registry for tombstone in batch.tombstones} == {"core.Param"}
+    batch = ln.Param.changes(batch.cursor)
+    assert list(batch.records) == list(batch.tombstones) == []
+    with pytest.raises(ValueError):
+        ln.ParamValue.changes()
+
+
+def test_hash_chain(setup_instance):
+    from lnschema_core.models import hash_chain, hash_chain_append
+
+    hashes = ["a1b2c3", "d4e5f6", "g7h8i9"]
+    assert hash_chain([]) is None
+    assert hash_chain(hashes) == hash_chain_append(hash_chain(hashes[:2]), hashes[2])
+    assert hash_chain(hashes) != hash_chain(hashes[::-1])
+    assert len(hash_chain(hashes)) == 22
+
+
+def test_verify_hash_chain(setup_instance):
+    import lnschema_core.models as ln
+
+    storage = ln.Storage.objects.first()
+    artifacts = [
+        _create_record(
+            ln.Artifact,
+            uid=f"verifyhashchain{i}0000",
+            storage=storage,
+            suffix=".txt",
+            hash=f"verify_hash_chain_{i}",
+            _hash_type="md5",
+            _key_is_virtual=True,
+            run=None,
+        )
+        for i in range(2)
+    ]
+    collection = _create_record(
+        ln.Collection, uid="verifyhashchain00000", name="verify_hash_chain", run=None
+    )
+    for position, artifact in enumerate(artifacts):
+        ln.CollectionArtifact(
+            collection=collection, artifact=artifact, position=position, run=None
+        ).save()
+    assert collection.verify_hash_chain() is None
+    hashes = [artifact.hash for artifact in artifacts]
+    collection._hash_chain = ln.hash_chain(hashes)
+    assert collection.verify_hash_chain() is True
+    collection._hash_chain = ln.hash_chain(hashes[::-1])
+    assert collection.verify_hash_chain() is False
+    ln.CollectionArtifact.objects.filter(collection=collection).delete()
+    for record in [collection, *artifacts]:
+        models.Model.delete(record)
+
+
+def test_artifacts_after(setup_instance):
+    import lnschema_core.models as ln
+
+    storage = ln.Storage.objects.first()
+    artifacts = [
+        _create_record(
+            ln.Artifact,
+            uid=f"artifactsafter{i}00000",
+            storage=storage,
+            suffix=".txt",
+            hash=f"artifacts_after_{i}",
+            _hash_type="md5",
+            _key_is_virtual=True,
+            run=None,
+        )
+        for i in range(5)
+    ]
+    collection = _create_record(
+        ln.Collection, uid="artifactsafter000000", name="artifacts_after", run=None
+    )
+    # links without a position, e.g., from earlier versions, come last
+    for position, artifact in zip([None, 2, 0, None, 1], artifacts):
+        ln.CollectionArtifact(
+            collection=collection, artifact=artifact, position=position, run=None
+        ).save()
+
+    def positions(cursor, limit):
+        return list(
+            collection.artifacts_after(cursor, limit=limit).values_list(
+                "collection_position", "collection_link_id"
+            )
+        )
+
+    rows = positions(None, 10)
+    assert [position for position, _ in rows] == [0, 1, 2, None, None]
+    assert rows[3][1] < rows[4][1]
+    pages, cursor = [], None
+    while page := positions(cursor, 2):
+        pages.append(page)
+        cursor = page[-1]
+    assert pages == [rows[:2], rows[2:4], rows[4:]]
+    ln.CollectionArtifact.objects.filter(collection=collection).delete()
+    for record in [collection, *artifacts]:
+        models.Model.delete(record)
+
+
+def test_hash_value(setup_instance):
+    from lnschema_core.models import hash_value
+
+    assert hash_value({"a": 1, "b": [1, 2]}) == hash_value({"b": [1, 2], "a": 1})
+    assert hash_value({"a": 1}) != hash_value({"a": 1.5})
+    assert hash_value(1) != hash_value("1")
+    assert hash_value(1) == hash_value(1.0)
+    assert hash_value({"lr": [1.0, 2.5]}) == hash_value({"lr": [1, 2.5]})
+    assert len(hash_value({"lr": 0.01, "layers": [32, 16]})) == 22
+
+
+def test_infer_feature_dtypes(setup_instance):
+    import pandas as pd
+    from lnschema_core.models import infer_feature_dtypes
+
+    df = pd.DataFrame(
+        {
+            "int": [1, 2],
+            "float": [1.0, 2.0],
+            "bool": [True, False],
+            "str": ["a", "b"],
+            "datetime": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+            "timedelta": pd.to_timedelta([1, 2], unit="s"),
+        }
+    )
+    df["cat"] = df["str"].astype("category")
+    df["int_nullable"] = df["int"].astype("Int64")
+    dtypes = infer_feature_dtypes(df)
+    assert dtypes.to_dict() == {
+        "int": "int",
+        "float": "float",
+        "bool": "bool",
+        "str": "cat",
+        "datetime": "datetime",
+        "timedelta": "object",
+        "cat": "cat",
+        "int_nullable": "int",
+    }
+    assert infer_feature_dtypes(df, str_as_cat=False)["str"] == "str"
+    assert infer_feature_dtypes(pd.DataFrame()).empty
+
+
+def test_to_typed_value(setup_instance):
+    from datetime import datetime, timezone
+
+    from lnschema_core.models import to_typed_value, typed_value_field
+
+    assert typed_value_field("num") == "_value_float"
+    assert typed_value_field("object") is None
+    assert to_typed_value("num", 37) == 37.0
+    assert to_typed_value("int", 3.0) == 3
+    assert to_typed_value("int", 3.5) is None
+    assert to_typed_value("float", True) is None
+    assert to_typed_value("bool", False) is False
+    assert to_typed_value("float", {"a": 1}) is None
+    assert to_typed_value("datetime", "2024-11-01T10:00:00") == datetime(
+        2024, 11, 1, 10, tzinfo=timezone.utc
+    )
+    assert to_typed_value("str", "x" * 256) is None
+
+
+def test_json_contains(setup_instance):
+    import lnschema_core.models as ln
+    from lnschema_core.models import json_contains
+
+    config = {"optimizer": {"name": "adam", "lr": 0.01}, "layers": [32, 16]}
+    q = json_contains({"optimizer": {"name": "adam"}}, vendor="postgresql")
+    assert q.children == [("value__contains", {"optimizer": {"name": "adam"}})]
+    q = json_contains(
+        {"optimizer": {"name": "adam"}, "layers": [32, 16]}, vendor="sqlite"
+    )
+    assert [(lookup.lhs.key_name, lookup.rhs.value) for lookup in q.children] == [
+        ("name", "adam"),
+        ("layers", [32, 16]),
+    ]
+    assert q.children[0].lhs.lhs.key_name == "optimizer"
+    with pytest.raises(ValueError):
+        json_contains({"0": "adam"}, vendor="sqlite")
+
+    param = ln.Param(name="config", dtype="object", run=None)
+    param.save()
+    ln.ParamValue(param=param, value=config).save()
+    ln.ParamValue(param=param, value={"optimizer": {"name": "sgd"}}).save()
+    queryset = ln.ParamValue.objects.filter(
+        json_contains({"optimizer": {"name": "adam"}})
+    )
+    assert [param_value.value for param_value in queryset] == [config]
+    # keys that are also lookup names
+    ln.ParamValue(param=param, value={"lt": 0.1}).save()
+    ln.ParamValue(param=param, value={"lt": 0.5}).save()
+    queryset = ln.ParamValue.objects.filter(json_contains({"lt": 0.1}))
+    assert [param_value.value for param_value in queryset] == [{"lt": 0.1}]
+    queryset = ln.ParamValue.objects.filter(json_contains({"optimizer": {"in": "x"}}))
+    assert not queryset.exists()
+    # an empty dictionary only requires the key
+    queryset = ln.ParamValue.objects.filter(json_contains({"optimizer": {}}))
+    assert sorted(
+        param_value.value["optimizer"]["name"] for param_value in queryset
+    ) == [
+        "adam",
+        "sgd",
+    ]
+    ln.ParamValue.objects.filter(param=param).delete()
+    ln.Param.objects.filter(id=param.id).delete()
+
+
+def test_get_or_create_many(setup_instance):
+    import lnschema_core.models as ln
+
+    param = ln.Param(name="get_or_create_many_param", dtype="int", run=None)
+    param.save()
+    param_values = ln.ParamValue.get_or_create_many(param, [1, 2, 1])
+    assert param_values[0] == param_values[2]
+    assert param_values[0] != param_values[1]
+    assert ln.ParamValue.objects.filter(param=param).count() == 2
+    # integral floats are the same value
+    assert ln.ParamValue.get_or_create_many(param, [1.0])[0] == param_values[0]
+    int_value, float_value = ln.ParamValue.get_or_create_many(param, [3, 3.0])
+    assert int_value == float_value
+    assert ln.ParamValue.objects.get(id=int_value.id)._value_int == 3
+    # bulk-created records lack a hash and are backfilled
+    ln.ParamValue.objects.bulk_create([ln.ParamValue(param=param, value=5)])
+    (param_value,) = ln.ParamValue.get_or_create_many(param, [5])
+    assert ln.ParamValue.objects.filter(param=param).count() == 4
+    param_value = ln.ParamValue.objects.get(id=param_value.id)
+    assert param_value.hash == ln.hash_value(5)
+    assert param_value._value_int == 5
+    ln.ParamValue.objects.filter(param=param).delete()
+    ln.Param.objects.filter(id=param.id).delete()
+
+
+def test_bulk_link(setup_instance):
+    import lnschema_core.models as ln
+    from django.db import IntegrityError
+
+    transform = ln.Transform(uid="bulkLinkTest0000", name="bulk link test")
+    transform.save()
+    runs = [ln.Run(transform=transform), ln.Run(transform=transform)]
+    for run in runs:
+        run.save()
+    param = ln.Param(name="bulk_link_param", dtype="int", run=None)
+    param.save()
+    param_values = ln.ParamValue.get_or_create_many(param, [1, 2, 1])
+
+    # the first and the last link are duplicates
+    run_ids = [runs[0].id, runs[0].id, runs[1].id, runs[0].id]
+    param_values = param_values + param_values[:1]
+    n_created = ln.RunParamValue.bulk_link(
+        run=run_ids, paramvalue=param_values, chunk_size=2
+    )
+    assert n_created == 3
+    assert ln.RunParamValue.bulk_link(run=run_ids, paramvalue=param_values) == 0
+    assert ln.RunParamValue.objects.filter(run__in=runs).count() == 3
+    ln.RunParamValue.objects.filter(run=runs[1]).delete()
+    n_created = ln.RunParamValue.bulk_link(
+        run=run_ids[2:3], paramvalue=param_values[2:3], check_existing=False
+    )
+    assert n_created == 1
+    assert ln.RunParamValue.objects.filter(run__in=runs).count() == 3
+    with pytest.raises(IntegrityError):
+        ln.RunParamValue.bulk_link(
+            run=run_ids[2:3], paramvalue=param_values[2:3], check_existing=False
+        )
+    with pytest.raises(ValueError):
+        ln.RunParamValue.bulk_link(run=run_ids, paramvalue=param_values[:1])
+
+    ln.RunParamValue.objects.filter(run__in=runs).delete()
+    ln.Param.objects.filter(id=param.id).delete()
+    ln.Transform.objects.filter(id=transform.id).delete()
+
+
+def test_feature_set_get_existing(setup_instance, monkeypatch):
+    import lnschema_core.models as ln
+    from lamindb_setup.core.hashing import hash_set
+
+    # lamindb implements __init__, which from_db() calls
+    monkeypatch.setattr(ln.FeatureSet, "__init__", models.Model.__init__)
+    uids = ["getExistingUid01", "getExistingUid02", "getExistingUid03"]
+    feature_set = _create_record(
+        ln.FeatureSet,
+        uid="getExistingSet000000",
+        n=len(uids),
+        registry="Feature",
+        hash=hash_set(set(uids)),
+        run=None,
+    )
+    assert ln.FeatureSet.get_existing(uids) == feature_set
+    assert ln.FeatureSet.get_existing(uids[::-1] + uids[:1]) == feature_set
+    assert ln.FeatureSet.get_existing(uids[:2]) is None
+    models.Model.delete(feature_set)
+
+
+def test_cached_member_ids(setup_instance):
+    import numpy as np
+    from lnschema_core.models import (
+        MEMBER_IDS_CACHE_SIZE,
+        cached_member_ids,
+        evict_member_ids,
+        member_ids_cache,
+    )
+
+    n_loads = []
+
+    def load():
+        n_loads.append(1)
+        return np.arange(3)
+
+    ids = cached_member_ids("default", "memberIdsHash0", load)
+    assert cached_member_ids("default", "memberIdsHash0", load) is ids
+    assert len(n_loads) == 1
+    assert not ids.flags.writeable
+    # the same hash in another database has other member ids
+    cached_member_ids("other", "memberIdsHash0", load)
+    assert len(n_loads) == 2
+    cached_member_ids("default", None, load)
+    assert len(n_loads) == 3
+    evict_member_ids("default", "memberIdsHash0")
+    assert ("other", "memberIdsHash0") in member_ids_cache
+    cached_member_ids("default", "memberIdsHash0", load)
+    assert len(n_loads) == 4
+    for i in range(MEMBER_IDS_CACHE_SIZE):
+        cached_member_ids("default", f"memberIdsHash{i + 1}", load)
+    assert ("other", "memberIdsHash0") not in member_ids_cache
+    assert len(member_ids_cache) == MEMBER_IDS_CACHE_SIZE
+    member_ids_cache.clear()
+
+
+def test_parse_dtype(setup_instance):
+    import lnschema_core.models as ln
+    from lnschema_core.models import parse_dtype
+
+    assert parse_dtype("float") == ("float", ())
+    assert parse_dtype("cat") == ("cat", ())
+    assert parse_dtype("cat[ULabel]") == ("cat", (ln.ULabel,))
+    parsed = parse_dtype("cat[ULabel|core.Transform]")
+    assert parsed.registries == (ln.ULabel, ln.Transform)
+    assert parse_dtype("cat[ULabel|core.Transform]") is parsed
+    for dtype in [
+        "cat[ULabel",
+        "float[ULabel]",
+        "cat[Unknown]",
+        "cat[bionty.CellType]",
+    ]:
+        with pytest.raises(ValueError):
+            parse_dtype(dtype)
+
+
+def test_dimension_dtype(setup_instance):
+    import lnschema_core.models as ln
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from lnschema_core.models import dimension_dtype
+
+    param = ln.Param(name="dimension_dtype_param", dtype="float", run=None)
+    param.save()
+    assert dimension_dtype(ln.ParamValue(param=param, value=1), "param") == "float"
+    param_value = ln.ParamValue(param_id=param.id, value=0.5)
+    assert dimension_dtype(param_value, "param") == "float"
+    with CaptureQueriesContext(connection) as context:
+        assert dimension_dtype(param_value, "param") == "float"
+    assert len(context.captured_queries) == 0
+    param_value.save()
+    assert param_value._value_float == 0.5
+    feature_value = ln.FeatureValue(value=1, run=None)
+    assert dimension_dtype(feature_value, "feature") is None
+    ln.Param.objects.filter(id=param.id).delete()